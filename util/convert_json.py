@@ -3,14 +3,17 @@ import json
 import sys
 import re
 
+YEAR_RE = re.compile("^\d{4}$")
+DATE_RE = re.compile("^(\d{4})[/,\-](\d+)[/,\-](\d+)$")
+
 if len(sys.argv) != 2:
     print "Usage: %s [file.json]" % sys.argv[0]
     sys.exit(0)
 def process_date(date_str):
-    if re.match("^\d{4}$", date_str):
+    if YEAR_RE.match(date_str):
         return { "year": date_str}
     try:
-        year,month,day = re.match("^(\d{4})[/,\-](\d+)[/,\-](\d+)$",date_str).groups()
+        year,month,day = DATE_RE.match(date_str).groups()
         return { "year": year, "month": month, "day": day }
     except AttributeError:
         pass